@@ -0,0 +1,33 @@
+"""
+Build script for the production fraud model.
+
+Assembles the Bayesian Network from the current weights and priors
+(validating it in dev) and saves the arrays FraudService loads.
+
+To run it from the command line, use:
+    poetry run python -m freq_app.build
+"""
+
+from freq_app.config.logging import get_logger
+from freq_app.model.model_builder import FraudBN
+from freq_app.model.persistence import save_model
+
+# Initialize logger
+logger = get_logger()
+
+
+def main():
+    """
+    Build, validate, and save the production model.
+
+    Overwrites src/freq_app/prod_model/prod_model.npz.
+
+    Returns:
+        None
+    """
+    model_path = save_model(FraudBN().assemble())
+    logger.success(f"Production model built: {model_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,51 @@
 """
 Logging configuration using Loguru.
 
-Logs are output to both console and a rotating file.
+Logs are output to a rotating file. Sinks are registered on the first
+get_logger() call rather than at import, so importing this module does
+no disk I/O.
 """
 
+from functools import lru_cache
+
 from loguru import logger
 
-from pathlib import Path
+from freq_app.paths import PACKAGE_ROOT
 
 
-# Ensure logs directory exists
-log_dir = Path(__file__).resolve().parents[2] / "logs"
-log_dir.mkdir(parents=True, exist_ok=True)
+@lru_cache(maxsize=1)
+def _configure():
+    """
+    Create the logs directory and register the rotating file sink.
 
-# Clear existing handlers (avoid duplicate logs)
-logger.remove()
+    Cached, so the sink is only registered once per process.
+    """
+    # Ensure logs directory exists
+    log_dir = PACKAGE_ROOT.parent / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
 
-# Console logging (off by default, can be enabled via settings)
-logger.remove()  # remove default stderr sink
+    # Clear existing handlers, including the default stderr sink
+    # (avoid duplicate logs)
+    logger.remove()
 
-# File logging (rotates automatically)
-logger.add(
-    log_dir / "app.log",
-    rotation="1 MB",
-    retention="10 days",
-    compression="zip",
-    level="DEBUG"
-)
+    # File logging (rotates automatically)
+    logger.add(
+        log_dir / "app.log",
+        rotation="1 MB",
+        retention="10 days",
+        compression="zip",
+        level="DEBUG"
+    )
 
 
 def get_logger():
     """
     Get the configured logger instance.
 
+    Configures the file sink on first use.
+
     Returns:
         logger: Configured Loguru logger instance.
     """
+    _configure()
     return logger
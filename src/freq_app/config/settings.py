@@ -1,23 +1,34 @@
 """
 Application settings.
 
-Uses pydantic-settings to read from environment variables and a .env file.
+Reads from environment variables and a .env file (parsed with
+python-dotenv) into a plain dataclass, so no validation framework is
+imported on cold start.
 """
 
-from pydantic import Field
-from pydantic_settings import BaseSettings
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from dotenv import dotenv_values
 
 # Define descriptive constants to avoid magic numbers
 DEFAULT_PORT: int = 8000
 DEFAULT_BASE_FRAUD_RATE: float = 0.02
 
+# .env file read by load_settings(); environment variables take precedence
+ENV_FILE: str = ".env"
+
+# Accepted spellings for boolean settings (compared case-insensitively)
+TRUE_VALUES = frozenset(("1", "true", "t", "yes", "y", "on"))
+FALSE_VALUES = frozenset(("0", "false", "f", "no", "n", "off"))
 
-class Settings(BaseSettings):
+
+@dataclass(frozen=True)
+class Settings:
     """
     Application settings.
 
-    Reads from environment variables and a .env file.
-
     Attributes:
         app_name (str): Name of the application.
         env (str): Environment (e.g., dev, prod).
@@ -25,43 +36,112 @@ class Settings(BaseSettings):
         build_weights (bool): Flag to indicate if weights should be built.
         raw_probs_file (str): Path to the raw probabilities file.
         base_fraud_rate (float): Base fraud rate for the model.
-
-    Methods:
-        Config: Configuration for pydantic settings.
     """
 
     # general
-    app_name: str = Field(default="Frequency", alias="APP_NAME")
-    env: str = Field(default="dev", alias="ENV")
-    port: int = Field(default=DEFAULT_PORT, alias="PORT")
-    build_weights: bool = Field(
-        default=False,
-        alias="BUILD_WEIGHTS"
-    )
+    app_name: str = "Frequency"
+    env: str = "dev"
+    port: int = DEFAULT_PORT
+    build_weights: bool = False
 
-    raw_probs_file: str = Field(
-        default="data/raw_probs.csv",
-        alias="RAW_PROBS_FILE"
-    )
+    raw_probs_file: str = "data/raw_probs.csv"
 
     # model
-    base_fraud_rate: float = Field(
-        default=DEFAULT_BASE_FRAUD_RATE,
-        alias="BASE_FRAUD_RATE"
-    )
+    base_fraud_rate: float = DEFAULT_BASE_FRAUD_RATE
+
+
+def _read_env_file(env_file: str) -> Dict[str, Optional[str]]:
+    """
+    Read key/value pairs from a .env file.
+
+    Args:
+        env_file (str): Path to the .env file.
+
+    Returns:
+        dict: Parsed values; empty if the file is missing.
+    """
+    if not os.path.exists(env_file):
+        return {}
+    return dotenv_values(env_file, encoding="utf-8")
+
 
-    class Config:
-        """Configuration for pydantic settings.
-        Reads from a .env file and environment variables.
+def _parse_bool(name: str, raw_value: str) -> bool:
+    """
+    Parse a boolean setting.
+
+    Raises:
+        ValueError: If the value is not a recognised boolean spelling.
+    """
+    normalised = raw_value.strip().lower()
+    if normalised in TRUE_VALUES:
+        return True
+    if normalised in FALSE_VALUES:
+        return False
+    raise ValueError(f"{name} must be a boolean, got {raw_value!r}")
+
+
+def _parse_number(name: str, raw_value: str, number_type: type):
+    """
+    Parse an int or float setting.
+
+    Raises:
+        ValueError: If the value is not a valid number of that type.
+    """
+    try:
+        return number_type(raw_value)
+    except ValueError:
+        raise ValueError(
+            f"{name} must be a valid {number_type.__name__}, got {raw_value!r}"
+        ) from None
 
-        Attributes:
-            env_file (str): Path to the .env file.
-            env_file_encoding (str): Encoding of the .env file.
-        """
 
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+def load_settings(env_file: str = ENV_FILE) -> Settings:
+    """
+    Build Settings from environment variables and a .env file.
+
+    Names are matched case-insensitively and environment variables
+    override values from the .env file. Only unset names fall back to
+    the Settings defaults; a set-but-empty value is parsed like any other.
+
+    Args:
+        env_file (str): Path to the .env file.
+
+    Returns:
+        Settings: Parsed application settings.
+
+    Raises:
+        ValueError: If a bool or numeric setting cannot be parsed.
+    """
+    raw_settings = {
+        name.upper(): raw_value
+        for source in (_read_env_file(env_file), os.environ)
+        for name, raw_value in source.items()
+        if raw_value is not None
+    }
+    defaults = Settings()
+
+    port = raw_settings.get("PORT")
+    build_weights = raw_settings.get("BUILD_WEIGHTS")
+    base_fraud_rate = raw_settings.get("BASE_FRAUD_RATE")
+
+    return Settings(
+        app_name=raw_settings.get("APP_NAME", defaults.app_name),
+        env=raw_settings.get("ENV", defaults.env),
+        port=(
+            defaults.port if port is None
+            else _parse_number("PORT", port, int)
+        ),
+        build_weights=(
+            defaults.build_weights if build_weights is None
+            else _parse_bool("BUILD_WEIGHTS", build_weights)
+        ),
+        raw_probs_file=raw_settings.get("RAW_PROBS_FILE", defaults.raw_probs_file),
+        base_fraud_rate=(
+            defaults.base_fraud_rate if base_fraud_rate is None
+            else _parse_number("BASE_FRAUD_RATE", base_fraud_rate, float)
+        ),
+    )
 
 
 # Create a singleton instance of Settings
-settings = Settings()
+settings = load_settings()
@@ -1,30 +1,94 @@
 """
 A module to build and manage a Bayesian Network for fraud detection.
 
-Builds, saves, loads, and scores the Bayesian Network model for
-fraud detection. Uses pgmpy for Bayesian Network operations.
+Builds, validates, and scores the Bayesian Network model for
+fraud detection. Uses pgmpy for Bayesian Network operations; saving
+and loading live in persistence.py.
 """
 
-from __future__ import annotations
-
-import pickle
 from itertools import product
-from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from loguru import logger
 from pgmpy.factors.discrete import TabularCPD
 from pgmpy.inference import VariableElimination
 from pgmpy.models import DiscreteBayesianNetwork
 
+from freq_app.config.settings import settings
 from freq_app.model.priors import build_priors, load_priors
-from freq_app.model.weights import bias, WEIGHTS
+from freq_app.model.scorer import FraudScorer
+from freq_app.model.weights import bias, STATE_INDEX, W_VEC
 from freq_app.utils.math_utils import sigmoid
 
+# Parent nodes of Fraud
+EVIDENCE_NODES = (
+    "Porting",
+    "DarkWeb",
+    "StateMatch",
+    "ProxyFlag",
+    "MAID_NightDistance",
+)
+
+# (P(Fraud), P(Legit))
+FraudPosterior = Tuple[float, float]
+# (parent states in EVIDENCE_NODES order) -> FraudPosterior
+PosteriorTable = Dict[Tuple[str, ...], FraudPosterior]
+
+
+def _weights_for(node: str, states: List[str]) -> np.ndarray:
+    """Return the FP64 weight vector of `node`, ordered like `states`."""
+    vector = W_VEC[node][[STATE_INDEX[node][state] for state in states]]
+    return vector.astype(np.float64)
+
+
+def fraud_cpd_from_table(
+    cpd_values: np.ndarray, parent_states: Dict[str, List[str]]
+) -> TabularCPD:
+    """
+    Build the Fraud CPD from its (2, n_assignments) value table.
+
+    Args:
+        cpd_values: rows P(Fraud = "Fraud") and P(Fraud = "Legit"), columns in
+            itertools.product order over the parent states.
+        parent_states: {node: state names} for every node in EVIDENCE_NODES.
+
+    Returns:
+        TabularCPD: CPD for variable "Fraud" with states ["Fraud", "Legit"]
+    """
+    return TabularCPD(
+        variable="Fraud",
+        variable_card=2,
+        values=cpd_values,
+        evidence=list(EVIDENCE_NODES),
+        evidence_card=[len(parent_states[node]) for node in EVIDENCE_NODES],
+        state_names={
+            "Fraud": ["Fraud", "Legit"],
+            # Copies: the lists may belong to the cached load_priors() dict
+            **{node: list(parent_states[node]) for node in EVIDENCE_NODES},
+        },
+    )
+
+
+def _posterior(
+    infer: VariableElimination, evidence: Dict[str, str]
+) -> FraudPosterior:
+    """Run a VE query and return (P(Fraud), P(Legit)) for the evidence."""
+    fraud_distribution = infer.query(
+        variables=["Fraud"],
+        evidence=evidence,
+        show_progress=False,
+    )
+    fraud_score = dict(zip(
+        fraud_distribution.state_names["Fraud"],
+        fraud_distribution.values)
+    )
+    return float(fraud_score["Fraud"]), float(fraud_score["Legit"])
+
 
 class FraudBN:
     """
-    Build, save, load, and score a Bayesian Network for fraud detection.
+    Build and score a Bayesian Network for fraud detection.
 
     Structure:
         Porting, DarkWeb, StateMatch, ProxyFlag, MAID_NightDistance -> Fraud
@@ -32,9 +96,11 @@ class FraudBN:
     Methods:
         - build_fraud_cpd(): construct Fraud CPD from logistic weights.
         - assemble(): add prior CPDs + Fraud CPD and validate the model.
+        - warmup(): pre-build the cached inference engine.
+        - score_case_fast(evidence): closed-form score for full evidence.
         - score_case(evidence): return P(Fraud), P(Legit) given evidence.
-        - save(): persist model to src/freq_app/prod_model/prod_model.pkl.
-        - load(): load model from the same path.
+
+    See persistence.save_model() / load_model() to store and reload it.
     """
 
     def __init__(self) -> None:
@@ -48,6 +114,10 @@ class FraudBN:
                 ("MAID_NightDistance", "Fraud"),
             ]
         )
+        # Inference engine, built lazily on first query (see warmup()).
+        self._infer: Optional[VariableElimination] = None
+        # Closed-form scorer for fully observed evidence.
+        self.scorer = FraudScorer.from_weights()
 
     def build_fraud_cpd(self) -> TabularCPD:
         """
@@ -66,39 +136,25 @@ class FraudBN:
         proxy_states = priors_data["ProxyFlag"]["states"]
         maid_states = priors_data["MAID_NightDistance"]["states"]
 
-        p_fraud_yes: List[float] = []
-        for p_state, d_state, s_state, x_state, m_state in product(
-            porting_states, darkweb_states, statematch_states, proxy_states, maid_states
-        ):
-            logit = (
-                bias +
-                WEIGHTS[f"Porting:{p_state}"] +
-                WEIGHTS[f"DarkWeb:{d_state}"] +
-                WEIGHTS[f"StateMatch:{s_state}"] +
-                WEIGHTS[f"ProxyFlag:{x_state}"] +
-                WEIGHTS[f"MAID_NightDistance:{m_state}"]
-            )
-            p_fraud_yes.append(sigmoid(logit))
-
-        fraud_cpd_matrix = [
-            p_fraud_yes,                           # P(Fraud = "Fraud")
-            [1.0 - prob for prob in p_fraud_yes],  # P(Fraud = "Legit")
-        ]
-
-        return TabularCPD(
-            variable="Fraud",
-            variable_card=2,
-            values=fraud_cpd_matrix,
-            evidence=[
-                "Porting",
-                "DarkWeb",
-                "StateMatch",
-                "ProxyFlag",
-                "MAID_NightDistance",
-            ],
-            evidence_card=[3, 4, 2, 2, 4],
-            state_names={
-                "Fraud": ["Fraud", "Legit"],
+        # Per-state weight vectors in CPD state order. np.ix_ reshapes them
+        # into an open mesh, so their sum broadcasts to a 5-D logit tensor
+        # whose C-order ravel matches itertools.product over the parent
+        # states.
+        w_port = _weights_for("Porting", porting_states)
+        w_dark = _weights_for("DarkWeb", darkweb_states)
+        w_sm = _weights_for("StateMatch", statematch_states)
+        w_px = _weights_for("ProxyFlag", proxy_states)
+        w_maid = _weights_for("MAID_NightDistance", maid_states)
+
+        logits = bias + sum(np.ix_(w_port, w_dark, w_sm, w_px, w_maid))
+        p_fraud = sigmoid(logits).ravel(order="C")
+
+        # Rows: P(Fraud = "Fraud"), P(Fraud = "Legit"); shape (2, 192)
+        fraud_cpd_matrix = np.stack([p_fraud, 1.0 - p_fraud], axis=0)
+
+        return fraud_cpd_from_table(
+            fraud_cpd_matrix,
+            {
                 "Porting": porting_states,
                 "DarkWeb": darkweb_states,
                 "StateMatch": statematch_states,
@@ -109,17 +165,60 @@ class FraudBN:
 
     def assemble(self) -> "FraudBN":
         """
-        Add prior CPDs and Fraud CPD, then validate the model.
+        Add prior CPDs and Fraud CPD, then validate the model (dev only).
         Returns:
             FraudBN: self (builder) so you can chain .score_case(...)
+
+        Raises:
+            RuntimeError: In dev, if the model or its CPDs are inconsistent.
         """
         fraud_cpd = self.build_fraud_cpd()
         prior_cpds = build_priors()
         self.model.add_cpds(*prior_cpds, fraud_cpd)
-        assert self.model.check_model(), "Model/CPDs inconsistent!"
-        logger.info("Bayesian Network assembled and validated.")
+        self._infer = None
+
+        # Full validation is for development only; it is skipped in other
+        # environments (an assert would also vanish under python -O).
+        if settings.env == "dev":
+            try:
+                self.model.check_model()
+            except ValueError as exc:
+                raise RuntimeError("Model/CPDs inconsistent!") from exc
+            validate_closed_form(
+                self.scorer, posterior_table(self.model, self.warmup()._infer)
+            )
+            logger.info("Bayesian Network assembled and validated.")
+        else:
+            logger.info("Bayesian Network assembled.")
+        return self
+
+    def warmup(self) -> "FraudBN":
+        """
+        Build the cached VariableElimination engine ahead of the first query.
+
+        Returns:
+            FraudBN: self, so it can be chained after assemble() / load_model().
+        """
+        if self._infer is None:
+            self._infer = VariableElimination(self.model)
         return self
 
+    def score_case_fast(self, evidence: Dict[str, str]) -> Dict[str, float]:
+        """
+        Score a case with every parent of Fraud observed, without pgmpy.
+
+        With all parents observed, variable elimination reduces to a
+        single Fraud CPD entry, computed by FraudScorer:
+            P(Fraud | e) = sigmoid(bias + sum(weight[state] for each parent))
+
+        Args:
+            evidence: dict with a state for every node in EVIDENCE_NODES.
+
+        Returns:
+            dict: {"Fraud": p_fraud, "Legit": p_legit}
+        """
+        return self.scorer.score(evidence)
+
     def score_case(self, evidence: Dict[str, str]) -> Dict[str, float]:
         """
         Score a case given evidence.
@@ -136,56 +235,56 @@ class FraudBN:
 
         Returns:
             dict: {"Fraud": p_fraud, "Legit": p_legit}
-        """
-        infer = VariableElimination(self.model)
-        fraud_distribution = infer.query(
-            variables=["Fraud"],
-            evidence=evidence,
-            show_progress=False,
-        )
-        fraud_score = dict(zip(
-            fraud_distribution.state_names["Fraud"],
-            fraud_distribution.values)
-        )
-        return {
-            "Fraud": float(fraud_score["Fraud"]),
-            "Legit": float(fraud_score["Legit"])
-        }
 
-    def save(self) -> Path:
-        """
-        Save the model to src/freq_app/prod_model/prod_model.pkl.
-        Creates the directory if missing.
+        Fully observed evidence is scored in closed form by
+        score_case_fast(); partial evidence falls back to variable
+        elimination.
         """
-        models_dir = (
-            Path(__file__).resolve().parent.parent / "prod_model"
-        )
-        models_dir.mkdir(parents=True, exist_ok=True)
+        if all(node in evidence for node in EVIDENCE_NODES):
+            return self.score_case_fast(evidence)
 
-        model_path = models_dir / "prod_model.pkl"
-        with open(model_path, "wb") as file_handle:
-            pickle.dump(self.model, file_handle)
+        self.warmup()
+        p_fraud, p_legit = _posterior(self._infer, evidence)
+        return {"Fraud": p_fraud, "Legit": p_legit}
 
-        logger.info(f"Model saved to {model_path}")
-        return model_path
 
-    @classmethod
-    def load(cls) -> "FraudBN":
-        """
-        Load the model from src/freq_app/prod_model/prod_model.pkl.
+def posterior_table(
+    model: DiscreteBayesianNetwork, infer: VariableElimination
+) -> PosteriorTable:
+    """
+    Run variable elimination for every fully observed parent assignment.
 
-        Returns:
-            FraudBN: instance with `model` populated.
-        """
-        models_dir = (
-            Path(__file__).resolve().parent.parent / "prod_model"
-        )
-        model_path = models_dir / "prod_model.pkl"
+    Args:
+        model: assembled network; its Fraud CPD defines the assignments.
+        infer: inference engine over `model`.
 
-        with open(model_path, "rb") as file_handle:
-            loaded_model = pickle.load(file_handle)
+    Returns:
+        dict: {(porting, darkweb, statematch, proxy, maid): (p_fraud, p_legit)}
+    """
+    fraud_cpd = model.get_cpds("Fraud")
+    assignments = product(
+        *(fraud_cpd.state_names[node] for node in EVIDENCE_NODES)
+    )
+    return {
+        states: _posterior(infer, dict(zip(EVIDENCE_NODES, states)))
+        for states in assignments
+    }
 
-        fraud_bn_obj = cls()
-        fraud_bn_obj.model = loaded_model
-        logger.info(f"Model loaded from {model_path}")
-        return fraud_bn_obj
+
+def validate_closed_form(scorer: FraudScorer, table: PosteriorTable) -> None:
+    """
+    Check closed-form scores against a posterior_table() from pgmpy.
+
+    Args:
+        scorer: closed-form scorer under test.
+        table: VE posteriors for every fully observed assignment.
+
+    Raises:
+        RuntimeError: If any closed-form score disagrees with VE.
+    """
+    for states, (p_fraud, _) in table.items():
+        fast_score = scorer.score(dict(zip(EVIDENCE_NODES, states)))
+        if not np.isclose(fast_score["Fraud"], p_fraud):
+            raise RuntimeError(
+                f"Closed-form score disagrees with inference for {states}"
+            )
@@ -0,0 +1,91 @@
+"""
+Save and load the fraud Bayesian Network as NumPy arrays.
+
+The artifact (MODEL_PATH) is a compressed .npz. Only arrays are stored:
+the scorer weights (see FraudScorer.to_arrays()) plus the Fraud CPD
+table and the prior of each evidence node, so loading needs neither
+unpickling nor pgmpy graph reconstruction:
+    cpd_table             (2, n_assignments) FP32 Fraud CPD values
+    cpd_states_<node>     parent state names, in Fraud CPD order
+    prior_states_<node>   state names of the node's prior CPD
+    priors_<node>         prior probability of each state
+"""
+
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from freq_app.model.model_builder import (
+    EVIDENCE_NODES,
+    FraudBN,
+    fraud_cpd_from_table,
+)
+from freq_app.model.priors import build_prior_cpd
+from freq_app.model.scorer import FraudScorer, MODEL_PATH
+from freq_app.model.weights import WEIGHT_DTYPE
+
+
+def save_model(fraud_bn: FraudBN, path: Path = MODEL_PATH) -> Path:
+    """
+    Save an assembled model to `path` (prod_model.npz by default).
+    Creates the directory if missing.
+
+    Args:
+        fraud_bn: assembled FraudBN to persist.
+        path: destination .npz file.
+
+    Returns:
+        Path: the file written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fraud_cpd = fraud_bn.model.get_cpds("Fraud")
+    arrays = fraud_bn.scorer.to_arrays()
+    # pgmpy holds CPD values as float64; store the table as FP32
+    arrays["cpd_table"] = fraud_cpd.get_values().astype(WEIGHT_DTYPE)
+    for node in EVIDENCE_NODES:
+        prior_cpd = fraud_bn.model.get_cpds(node)
+        arrays[f"cpd_states_{node}"] = np.array(fraud_cpd.state_names[node])
+        arrays[f"prior_states_{node}"] = np.array(prior_cpd.state_names[node])
+        arrays[f"priors_{node}"] = prior_cpd.get_values().ravel()
+
+    with open(path, "wb") as file_handle:
+        np.savez_compressed(file_handle, **arrays)
+
+    logger.info(f"Model saved to {path}")
+    return path
+
+
+def load_model(path: Path = MODEL_PATH) -> FraudBN:
+    """
+    Load a model saved by save_model().
+
+    Args:
+        path: .npz file to read.
+
+    Returns:
+        FraudBN: instance with `model` and `scorer` populated.
+    """
+    fraud_bn = FraudBN()
+    with np.load(path) as arrays:
+        fraud_bn.scorer = FraudScorer.from_arrays(arrays)
+        prior_cpds = [
+            build_prior_cpd(
+                node,
+                arrays[f"prior_states_{node}"].tolist(),
+                arrays[f"priors_{node}"].tolist(),
+            )
+            for node in EVIDENCE_NODES
+        ]
+        fraud_cpd = fraud_cpd_from_table(
+            arrays["cpd_table"],
+            {
+                node: arrays[f"cpd_states_{node}"].tolist()
+                for node in EVIDENCE_NODES
+            },
+        )
+
+    fraud_bn.model.add_cpds(*prior_cpds, fraud_cpd)
+    logger.info(f"Model loaded from {path}")
+    return fraud_bn
@@ -3,31 +3,56 @@ Load prior probability distributions for evidence nodes
 from JSON and build TabularCPDs for the Bayesian network.
 """
 
-import json
-from pathlib import Path
+from functools import lru_cache
 from loguru import logger
 from pgmpy.factors.discrete import TabularCPD
 
-PRIORS_FILE = Path(__file__).resolve().parent.parent / "data" / "priors.json"
+from freq_app.paths import PACKAGE_ROOT
+from freq_app.utils.json_utils import read_json
 
+PRIORS_FILE = PACKAGE_ROOT / "data" / "priors.json"
 
+
+@lru_cache(maxsize=1)
 def load_priors():
     """
     Load priors from a JSON file.
 
+    The file is read once per process; later calls return the cached
+    dict, so callers must not mutate it.
+
     Returns:
         dict: Priors with states and probabilities.
     """
     if not PRIORS_FILE.exists():
         raise FileNotFoundError(f"Priors file not found at {PRIORS_FILE}")
 
-    with open(PRIORS_FILE, "r", encoding="utf-8") as priors_file:
-        priors = json.load(priors_file)
+    priors = read_json(PRIORS_FILE)
 
     logger.info(f"Loaded priors from {PRIORS_FILE}")
     return priors
 
 
+def build_prior_cpd(node_name, states, probabilities):
+    """
+    Build an unconditional TabularCPD for one evidence node.
+
+    Args:
+        node_name (str): Node name.
+        states (list[str]): State names.
+        probabilities (list[float]): Prior probability of each state.
+
+    Returns:
+        TabularCPD: Unconditional CPD for the node.
+    """
+    return TabularCPD(
+        variable=node_name,
+        variable_card=len(states),
+        values=[[probability] for probability in probabilities],
+        state_names={node_name: list(states)},
+    )
+
+
 def build_priors():
     """
     Build TabularCPDs for all priors in the JSON file.
@@ -39,12 +64,7 @@ def build_priors():
     cpds = []
 
     for node_name, spec in priors_data.items():
-        cpd = TabularCPD(
-            variable=node_name,
-            variable_card=len(spec["states"]),
-            values=[[probability] for probability in spec["values"]],
-            state_names={node_name: spec["states"]},
-        )
+        cpd = build_prior_cpd(node_name, spec["states"], spec["values"])
         cpds.append(cpd)
 
     logger.info("Built TabularCPDs for priors.")
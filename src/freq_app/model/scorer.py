@@ -0,0 +1,244 @@
+"""
+Lightweight closed-form scorer for fully observed cases.
+
+With every parent of Fraud observed, the Bayesian network posterior is
+a single Fraud CPD entry:
+    P(Fraud | e) = sigmoid(bias + sum(weight[state] for each feature))
+
+FraudScorer computes exactly that from the logistic weights, without
+importing pgmpy. weights.py (which reads, and may retrain, weights.json)
+is only imported by from_weights(), so loading a saved model stays
+self-contained. It is what the service uses at
+request time; FraudBN (pgmpy-backed) is for building and validation.
+
+The production artifact (MODEL_PATH) is a compressed .npz holding the
+scorer arrays below, plus the CPD arrays FraudBN needs to rebuild the
+network (see persistence.py):
+    bias                  scalar log-odds intercept
+    features              feature names, in weight-table row order
+    states_<feature>      state names, in state-id order
+    weights_<feature>     weights, in state-id order
+"""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+from freq_app.paths import PACKAGE_ROOT
+from freq_app.utils.math_utils import logistic, sigmoid
+
+# Where the production model is persisted
+MODELS_DIR = PACKAGE_ROOT / "prod_model"
+MODEL_PATH = MODELS_DIR / "prod_model.npz"
+
+
+def flatten_weights(
+    weight_vectors: Mapping[str, np.ndarray],
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Stack per-feature weight vectors into one zero-padded 2-D array.
+
+    Args:
+        weight_vectors (Mapping[str, np.ndarray]): {feature: weights by state id}
+
+    Returns:
+        Tuple of (features, weight_table)
+        features: feature names, in row order.
+        weight_table: (n_features, max_states) array, in the vectors' dtype.
+    """
+    features = tuple(weight_vectors)
+    max_states = max(len(vector) for vector in weight_vectors.values())
+    weight_table = np.zeros(
+        (len(features), max_states),
+        dtype=np.result_type(*weight_vectors.values()),
+    )
+    for row, feature in enumerate(features):
+        vector = weight_vectors[feature]
+        weight_table[row, :len(vector)] = vector
+    return features, weight_table
+
+
+def _encode(
+    case: Dict[str, str],
+    features: Tuple[str, ...],
+    state_index: Dict[str, Dict[str, int]],
+) -> List[int]:
+    """Map a case to its state ids, in `features` order."""
+    missing = [feature for feature in features if feature not in case]
+    if missing:
+        raise ValueError(
+            f"Case is missing evidence for {missing}; "
+            "use FraudBN.score_case for partial evidence."
+        )
+    return [state_index[feature][case[feature]] for feature in features]
+
+
+class FraudScorer:
+    """
+    Score fully observed cases from logistic weights.
+
+    Attributes:
+        bias (float): Log-odds intercept.
+        features (Tuple[str, ...]): Feature names, in weight-table row order.
+        state_index (Dict[str, Dict[str, int]]): {feature: {state: id}}.
+        weight_table (np.ndarray): (n_features, max_states) FP32 weights.
+
+    Methods:
+        - from_weights(): build from the weights loaded by weights.py.
+        - from_arrays(arrays) / to_arrays(): convert to/from .npz arrays.
+        - load(path): build from a saved .npz artifact.
+        - score(case): return P(Fraud), P(Legit) for a full case.
+        - score_batch(cases): vectorized score() over many cases.
+    """
+
+    def __init__(
+        self,
+        bias: float,
+        features: Tuple[str, ...],
+        state_index: Dict[str, Dict[str, int]],
+        weight_table: np.ndarray,
+    ) -> None:
+        """Store the encoded weights."""
+        self.bias = bias
+        self.features = features
+        self.state_index = state_index
+        self.weight_table = weight_table
+        # {feature: {state: weight}} as Python floats, for per-case scoring
+        self._state_weights = {
+            feature: {
+                state: float(weight_table[row, state_id])
+                for state, state_id in state_index[feature].items()
+            }
+            for row, feature in enumerate(features)
+        }
+
+    @classmethod
+    def from_weights(cls) -> "FraudScorer":
+        """
+        Build a scorer from the module-level weights in weights.py.
+
+        weights.py is imported here rather than at module level: importing
+        it loads (or, with BUILD_WEIGHTS=true, retrains) weights.json,
+        which scoring from a saved model must not depend on.
+
+        Returns:
+            FraudScorer: scorer using the current weights.json.
+        """
+        weights = importlib.import_module("freq_app.model.weights")
+        features, weight_table = flatten_weights(weights.W_VEC)
+        return cls(weights.bias, features, weights.STATE_INDEX, weight_table)
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray]) -> "FraudScorer":
+        """
+        Build a scorer from arrays in the layout written by to_arrays().
+
+        Args:
+            arrays: mapping such as an opened np.load() .npz file.
+
+        Returns:
+            FraudScorer: scorer using the stored weights.
+        """
+        state_index = {}
+        weight_vectors = {}
+        for feature in arrays["features"].tolist():
+            states = arrays[f"states_{feature}"].tolist()
+            state_index[feature] = {
+                state: state_id for state_id, state in enumerate(states)
+            }
+            weight_vectors[feature] = arrays[f"weights_{feature}"]
+        features, weight_table = flatten_weights(weight_vectors)
+        return cls(float(arrays["bias"]), features, state_index, weight_table)
+
+    @classmethod
+    def load(cls, path: Path = MODEL_PATH) -> "FraudScorer":
+        """
+        Build a scorer from a saved .npz artifact, without pgmpy.
+
+        Args:
+            path: .npz file written by persistence.save_model().
+
+        Returns:
+            FraudScorer: scorer using the stored weights.
+        """
+        with np.load(path) as arrays:
+            return cls.from_arrays(arrays)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Export the scorer as named arrays for np.savez.
+
+        Returns:
+            dict: arrays in the layout read by from_arrays().
+        """
+        arrays = {
+            "bias": np.float64(self.bias),
+            "features": np.array(self.features),
+        }
+        for row, feature in enumerate(self.features):
+            states = list(self.state_index[feature])
+            arrays[f"states_{feature}"] = np.array(states)
+            arrays[f"weights_{feature}"] = self.weight_table[row, :len(states)]
+        return arrays
+
+    def score(self, case: Dict[str, str]) -> Dict[str, float]:
+        """
+        Score a case with every feature observed.
+
+        Args:
+            case: dict with a state for every feature, e.g.
+                {
+                    "Porting": "Recent",
+                    "DarkWeb": "High",
+                    "StateMatch": "No",
+                    "ProxyFlag": "Yes",
+                    "MAID_NightDistance": "Distant"
+                }
+
+        Returns:
+            dict: {"Fraud": p_fraud, "Legit": p_legit}
+
+        Raises:
+            ValueError: If any feature is missing from the case.
+        """
+        try:
+            log_odds = self.bias + sum(
+                self._state_weights[feature][case[feature]]
+                for feature in self.features
+            )
+        except KeyError:
+            # Re-encode for a descriptive error (missing feature / state)
+            _encode(case, self.features, self.state_index)
+            raise
+
+        p_fraud = logistic(log_odds)
+        return {"Fraud": p_fraud, "Legit": 1.0 - p_fraud}
+
+    def score_batch(self, cases: List[Dict[str, str]]) -> np.ndarray:
+        """
+        Score many fully observed cases in one vectorized pass.
+
+        Args:
+            cases: list of case dicts, each as accepted by score().
+
+        Returns:
+            np.ndarray: (len(cases), 2) array; column 0 is P(Fraud) and
+            column 1 is P(Legit).
+
+        Raises:
+            ValueError: If any case is missing a feature.
+        """
+        state_ids = np.array(
+            [_encode(case, self.features, self.state_index) for case in cases],
+            dtype=np.int64,
+        ).reshape(len(cases), len(self.features))
+        rows = np.arange(len(self.features))
+        logits = self.bias + self.weight_table[rows, state_ids].sum(
+            axis=1, dtype=np.float64
+        )
+        p_fraud = sigmoid(logits)
+        return np.stack([p_fraud, 1.0 - p_fraud], axis=1)
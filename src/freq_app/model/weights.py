@@ -13,20 +13,36 @@ Format of weights.json:
 }
 These weights are used in the logistic regression model to compute
 the log-odds of fraud given the features.
+
+For hot-path scoring the weights are also exposed integer-indexed:
+    STATE_INDEX["Porting"]["Recent"] -> 0
+    W_VEC["Porting"][0]              -> weight of Porting:Recent
 """
 
-import json
 import math
+from typing import Dict, Tuple
 
+import numpy as np
 from loguru import logger
 from pathlib import Path
 
 from freq_app.config.settings import settings
+from freq_app.utils.json_utils import read_json, write_json
 
 
 # Constants  weights path
 WEIGHTS_FILE = Path("src/freq_app/data/weights.json")
 
+# Storage precision of the indexed weight vectors. FP32 is far finer than
+# the calibration of the priors; the bias stays a Python float (FP64), so
+# log-odds are still accumulated in FP64.
+WEIGHT_DTYPE = np.float32
+
+# {feature: {state: id}}
+StateIndex = Dict[str, Dict[str, int]]
+# {feature: WEIGHT_DTYPE weights indexed by state id}
+WeightVectors = Dict[str, np.ndarray]
+
 
 def logit(probability: float) -> float:
     """
@@ -37,12 +53,17 @@ def logit(probability: float) -> float:
 
     Returns:
         float: Logit value.
+
+    Raises:
+        ValueError: If the probability is not strictly between 0 and 1.
     """
 
     # Validate input
     if not (0.0 < probability < 1.0):
-        logger.info(f"Probability {probability} must be between 0 and 1")
-    return math.log(probability / (1 - probability))
+        raise ValueError(f"Probability {probability} must be between 0 and 1")
+
+    # log(p) - log(1 - p), with log1p staying accurate for p near 0 or 1
+    return math.log(probability) - math.log1p(-probability)
 
 
 def train_and_save_weights():
@@ -55,26 +76,25 @@ def train_and_save_weights():
     raw_file = Path(settings.raw_probs_file)
     # Validate it exists
     if not raw_file.exists():
-        logger.info(f"Missing raw_probs.json at {raw_file}")
+        raise FileNotFoundError(f"Missing raw_probs.json at {raw_file}")
 
     # Load it
-    with open(raw_file, "r") as target_file:
-        raw_probs = json.load(target_file)
+    raw_probs = read_json(raw_file)
 
     # Compute bias
     bias = logit(settings.base_fraud_rate)
 
     # Compute per-state weights
-    weights = {}
-    for feature, states in raw_probs.items():
-        for state, probability in states.items():
-            weights[f"{feature}:{state}"] = logit(probability) - bias
+    weights = {
+        f"{feature}:{state}": logit(probability) - bias
+        for feature, states in raw_probs.items()
+        for state, probability in states.items()
+    }
 
     # Save them to weights.json
     payload = {"bias": bias, "weights": weights}
     WEIGHTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(WEIGHTS_FILE, "w") as target_file:
-        json.dump(payload, target_file, indent=2)
+    write_json(WEIGHTS_FILE, payload)
 
     logger.info(f" Weights written to {WEIGHTS_FILE}")
     return bias, weights
@@ -105,14 +125,46 @@ def load_weights():
         return train_and_save_weights()
 
     # Load existing weights
-    with open(WEIGHTS_FILE, "r") as target_file:
-        weights_data = json.load(target_file)
+    weights_data = read_json(WEIGHTS_FILE)
 
     # Return bias and weights
     return weights_data["bias"], weights_data["weights"]
 
 
+def index_weights(
+    weights: Dict[str, float],
+) -> Tuple[StateIndex, WeightVectors]:
+    """
+    Encode "feature:state" weights as per-feature integer-indexed vectors.
+
+    States are numbered in the order they appear in the weights dict.
+
+    Args:
+        weights (Dict[str, float]): Weights keyed by "feature:state".
+
+    Returns:
+        Tuple of (state_index, weight_vectors)
+        state_index: {feature: {state: id}}
+        weight_vectors: {feature: WEIGHT_DTYPE weights indexed by state id}
+    """
+    state_index: StateIndex = {}
+    for key in weights:
+        feature, state = key.split(":", 1)
+        feature_states = state_index.setdefault(feature, {})
+        feature_states[state] = len(feature_states)
+
+    weight_vectors = {
+        feature: np.array(
+            [weights[f"{feature}:{state}"] for state in states],
+            dtype=WEIGHT_DTYPE,
+        )
+        for feature, states in state_index.items()
+    }
+    return state_index, weight_vectors
+
+
 # Initialize model parameters (bias + weights) at module load.
 # This makes them immediately available to other modules via:
-#     from freq_app.model.weights import bias, WEIGHTS
+#     from freq_app.model.weights import bias, WEIGHTS, STATE_INDEX, W_VEC
 bias, WEIGHTS = load_weights()
+STATE_INDEX, W_VEC = index_weights(WEIGHTS)
@@ -0,0 +1,7 @@
+"""Filesystem locations of the freq_app package."""
+
+from pathlib import Path
+
+# Package directory, computed once. No resolve(): the realpath syscalls
+# are not needed to locate bundled data/model files.
+PACKAGE_ROOT = Path(__file__).parent
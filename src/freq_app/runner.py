@@ -22,9 +22,15 @@ def run_case(case: dict) -> dict:
     service = FraudService()
     fraud_result = service.score(case)
 
-    logger.info(f"Scored case: {case}")
-    logger.success(f"Fraud probability: {fraud_result['Fraud']:.4f}")
-    logger.success(f"Legit probability: {fraud_result['Legit']:.4f}")
+    # Lazy formatting: messages are only built if a sink accepts the level
+    lazy_logger = logger.opt(lazy=True)
+    lazy_logger.info("Scored case: {}", lambda: case)
+    lazy_logger.success(
+        "Fraud probability: {:.4f}", lambda: fraud_result["Fraud"]
+    )
+    lazy_logger.success(
+        "Legit probability: {:.4f}", lambda: fraud_result["Legit"]
+    )
 
     return fraud_result
 
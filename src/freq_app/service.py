@@ -1,68 +1,70 @@
 """
 Service layer for fraud detection application.
 
-Handles model loading, building, and scoring.
-If no model is found, it builds a new one.
+Scores cases with the lightweight closed-form FraudScorer, loaded from
+the saved model arrays (or built from weights.json if no model has been
+saved; build one with `make build`). pgmpy is not imported here: the
+Bayesian network (FraudBN) is only needed to build and validate the
+model, not to score fully observed cases.
 """
 
-from pathlib import Path
-
+import numpy as np
 from loguru import logger
-from freq_app.model.model_builder import FraudBN
+from freq_app.model.scorer import FraudScorer, MODEL_PATH
 
 
 class FraudService:
     """Service class for fraud detection.
-    Loads or builds the fraud detection model and provides scoring
-    functionality.
+    Loads the scoring weights and provides scoring functionality.
 
     Attributes:
-        bn (FraudBN): The Bayesian Network model for fraud detection.
+        scorer (FraudScorer): Closed-form scorer for fully observed cases.
 
     Methods:
-        __init__(): Initializes the service, loading or building the model.
+        __init__(): Initializes the service and loads the scorer.
         score(case: dict) -> dict: Scores a single case and returns
         fraud / legit probabilities.
+        score_batch(cases: list) -> np.ndarray: Scores many cases at once.
     """
 
     def __init__(self):
         """
         Initialize the FraudService.
 
-        Loads an existing model or builds a new one if none is found.
-
-        Raises:
-            FileNotFoundError: If the model file does not exist and
-            cannot be built.
+        Loads the scorer from the saved model, or builds it from the
+        current weights if none is found.
         """
-
-        # Define path for prod_model
-        model_path = (
-            Path(__file__).resolve().parent / "prod_model" / "prod_model.pkl"
-        )
-
-        # Ensure the directory exists
-        if not model_path.exists():
-            logger.info(f"Model not found: {model_path} - building new model.")
-
-            # Build and save the model
-            self.bn = FraudBN().assemble()
-            self.bn.save()
+        if MODEL_PATH.exists():
+            logger.info(f"Model found: {MODEL_PATH} - loading the model.")
+            self.scorer = FraudScorer.load(MODEL_PATH)
         else:
-            logger.info(f"Model found: {model_path} - loading the model.")
-
-            # Load the existing model
-            self.bn = FraudBN.load()
+            logger.info(f"Model not found: {MODEL_PATH} - using weights.json.")
+            self.scorer = FraudScorer.from_weights()
 
     def score(self, case: dict) -> dict:
         """
         Score a single case and return fraud/legit probabilities.
         Args:
             case (dict): A dictionary representing the case to be scored.
+                Every feature must be observed.
 
         Returns:
             dict: A dictionary with fraud and legit probabilities.
         """
 
-        # Score the case using the Bayesian Network model
-        return self.bn.score_case(case)
+        # Score the case in closed form
+        return self.scorer.score(case)
+
+    def score_batch(self, cases: list) -> np.ndarray:
+        """
+        Score a batch of cases in one vectorized pass.
+        Args:
+            cases (list): Case dictionaries, each as accepted by score().
+
+        Returns:
+            np.ndarray: (len(cases), 2) array of fraud and legit
+            probabilities, one row per case.
+        """
+
+        # Score all cases together
+        return self.scorer.score_batch(cases)
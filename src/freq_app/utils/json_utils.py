@@ -0,0 +1,34 @@
+"""
+JSON file helpers for frequency application.
+
+Uses orjson, which parses bytes directly (no text decode step) and is
+faster than the stdlib json module for these small data files.
+"""
+
+from pathlib import Path
+
+import orjson
+
+
+def read_json(path: Path):
+    """
+    Read and parse a JSON file.
+
+    Args:
+        path (Path): File to read.
+
+    Returns:
+        Parsed JSON content.
+    """
+    return orjson.loads(path.read_bytes())
+
+
+def write_json(path: Path, payload) -> None:
+    """
+    Write a payload to a JSON file, indented by two spaces.
+
+    Args:
+        path (Path): File to write.
+        payload: JSON-serialisable content.
+    """
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
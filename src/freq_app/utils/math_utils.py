@@ -9,6 +9,12 @@ probability transformations.
 import math
 
 from loguru import logger
+from scipy.special import expit, logit
+
+# Standard logistic sigmoid: converts log-odds into probability between
+# 0 and 1. scipy's expit is a vectorized C ufunc that accepts scalars and
+# arrays alike and stays stable for large |x|.
+sigmoid = expit
 
 
 def bias_for_base_rate(base_rate: float) -> float:
@@ -34,21 +40,23 @@ def bias_for_base_rate(base_rate: float) -> float:
         logger.info("Base rate must be between 0 and 1 (exclusive).")
 
     # Calculate log-odds
-    return math.log(base_rate / (1.0 - base_rate))
+    return float(logit(base_rate))
 
 
-def sigmoid(input_val: float) -> float:
+def logistic(log_odds: float) -> float:
     """
-    Standard logistic sigmoid.
+    Scalar logistic sigmoid for the per-case hot path.
 
-    Converts log-odds into probability between 0 and 1.
+    Plain math is cheaper than a ufunc call for a single value; written
+    to avoid overflow in exp for large |log_odds|.
 
     Args:
-        input_val (float): Log-odds value.
+        log_odds (float): Log-odds value.
 
     Returns:
-        float:
+        float: Probability between 0 and 1.
     """
-
-    # Compute sigmoid
-    return 1.0 / (1.0 + math.exp(-input_val))
+    if log_odds >= 0:
+        return 1.0 / (1.0 + math.exp(-log_odds))
+    exp_log_odds = math.exp(log_odds)
+    return exp_log_odds / (1.0 + exp_log_odds)
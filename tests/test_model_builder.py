@@ -0,0 +1,81 @@
+"""Tests for FraudBN construction and validation."""
+
+from dataclasses import replace
+
+import pytest
+
+from freq_app.config.settings import settings
+from freq_app.model import model_builder
+from freq_app.model.model_builder import (
+    EVIDENCE_NODES,
+    FraudBN,
+    posterior_table,
+    validate_closed_form,
+)
+from freq_app.model.priors import build_prior_cpd, build_priors, load_priors
+from freq_app.model.scorer import FraudScorer
+
+
+@pytest.fixture
+def inconsistent_priors(monkeypatch):
+    """Make assemble() add a Porting prior that does not sum to 1."""
+    def broken_priors():
+        states = load_priors()["Porting"]["states"]
+        cpds = [cpd for cpd in build_priors() if cpd.variable != "Porting"]
+        return [*cpds, build_prior_cpd("Porting", states, [0.9] * len(states))]
+
+    monkeypatch.setattr(model_builder, "build_priors", broken_priors)
+
+
+def use_env(monkeypatch, env):
+    """Run model_builder with settings.env set to `env`."""
+    monkeypatch.setattr(model_builder, "settings", replace(settings, env=env))
+
+
+def test_fraud_cpd_copies_cached_states():
+    """The Fraud CPD must not share state lists with load_priors()."""
+    fraud_cpd = FraudBN().build_fraud_cpd()
+    for node in EVIDENCE_NODES:
+        cached_states = load_priors()[node]["states"]
+        assert fraud_cpd.state_names[node] == cached_states
+        assert fraud_cpd.state_names[node] is not cached_states
+
+
+def test_validate_closed_form_detects_mismatch():
+    """A scorer that disagrees with VE is rejected."""
+    built = FraudBN().assemble()
+    table = posterior_table(built.model, built.warmup()._infer)
+    assert len(table) == 192
+    validate_closed_form(built.scorer, table)
+
+    scorer = built.scorer
+    shifted = FraudScorer(
+        scorer.bias + 1.0,
+        scorer.features,
+        scorer.state_index,
+        scorer.weight_table,
+    )
+    with pytest.raises(RuntimeError, match="disagrees"):
+        validate_closed_form(shifted, table)
+
+
+def test_assemble_rejects_inconsistent_model_in_dev(
+    monkeypatch, inconsistent_priors
+):
+    """In dev, check_model() failures surface as RuntimeError."""
+    use_env(monkeypatch, "dev")
+    with pytest.raises(RuntimeError, match="inconsistent"):
+        FraudBN().assemble()
+
+
+def test_assemble_skips_validation_outside_dev(
+    monkeypatch, inconsistent_priors
+):
+    """Outside dev, assemble() neither checks the model nor validates."""
+    def fail_validation(*args):
+        raise AssertionError("validate_closed_form() should not run")
+
+    use_env(monkeypatch, "prod")
+    monkeypatch.setattr(model_builder, "validate_closed_form", fail_validation)
+    fraud_bn = FraudBN().assemble()
+    assert fraud_bn.model.get_cpds("Fraud") is not None
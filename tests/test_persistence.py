@@ -0,0 +1,50 @@
+"""Tests for saving and loading the model arrays."""
+
+import numpy as np
+import pytest
+
+from freq_app.model.model_builder import FraudBN
+from freq_app.model.persistence import load_model, save_model
+from freq_app.model.scorer import FraudScorer
+
+# Stored CPD table and weights are FP32
+FP32_ATOL = 1e-6
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """Save location away from the committed production model."""
+    return tmp_path / "prod_model" / "prod_model.npz"
+
+
+def test_save_load_round_trip(model_path):
+    """A saved model reloads with the same Fraud CPD and scores."""
+    built = FraudBN().assemble()
+    assert save_model(built, model_path) == model_path
+
+    loaded = load_model(model_path)
+    scorer = FraudScorer.load(model_path)
+
+    assert loaded.model.check_model()
+    built_cpd = built.model.get_cpds("Fraud")
+    loaded_cpd = loaded.model.get_cpds("Fraud")
+    assert loaded_cpd.state_names == built_cpd.state_names
+    np.testing.assert_allclose(
+        loaded_cpd.get_values(), built_cpd.get_values(), atol=FP32_ATOL
+    )
+
+    case = {
+        "Porting": "Recent",
+        "DarkWeb": "High",
+        "StateMatch": "No",
+        "ProxyFlag": "Yes",
+        "MAID_NightDistance": "Distant",
+    }
+    expected = built.score_case(case)
+    for score in (loaded.score_case(case), scorer.score(case)):
+        assert score == pytest.approx(expected, abs=FP32_ATOL)
+
+    partial_case = {"Porting": "Old"}
+    assert loaded.score_case(partial_case) == pytest.approx(
+        built.score_case(partial_case), abs=FP32_ATOL
+    )
@@ -0,0 +1,57 @@
+"""Tests for the closed-form FraudScorer."""
+
+from itertools import product
+
+import numpy as np
+import pytest
+
+from freq_app.model.scorer import FraudScorer
+
+
+@pytest.fixture
+def scorer():
+    """Scorer built from the current weights.json."""
+    return FraudScorer.from_weights()
+
+
+@pytest.fixture
+def all_cases(scorer):
+    """Every fully observed case (one per parent-state combination)."""
+    return [
+        dict(zip(scorer.features, states))
+        for states in product(
+            *(scorer.state_index[feature] for feature in scorer.features)
+        )
+    ]
+
+
+def test_score_batch_matches_score(scorer, all_cases):
+    """score_batch agrees with score() row by row on every case."""
+    assert len(all_cases) == 192
+
+    batch = scorer.score_batch(all_cases)
+    expected = np.array(
+        [
+            [score["Fraud"], score["Legit"]]
+            for score in map(scorer.score, all_cases)
+        ]
+    )
+
+    assert batch.shape == (192, 2)
+    np.testing.assert_allclose(batch, expected, rtol=0, atol=1e-12)
+
+
+def test_score_batch_empty(scorer):
+    """An empty batch returns an empty (0, 2) array."""
+    assert scorer.score_batch([]).shape == (0, 2)
+
+
+def test_missing_feature_raises(scorer, all_cases):
+    """Cases without every feature are rejected with ValueError."""
+    partial_case = dict(all_cases[0])
+    del partial_case["DarkWeb"]
+
+    with pytest.raises(ValueError, match="DarkWeb"):
+        scorer.score(partial_case)
+    with pytest.raises(ValueError, match="DarkWeb"):
+        scorer.score_batch([all_cases[0], partial_case])
@@ -0,0 +1,30 @@
+"""Tests for FraudService start-up."""
+
+import os
+import subprocess
+import sys
+
+from freq_app.paths import PACKAGE_ROOT
+
+# Imports FraudService, loads the saved model and reports which heavy
+# modules were pulled in along the way.
+SCRIPT = """
+import sys
+from freq_app.service import FraudService
+FraudService()
+print("freq_app.model.weights" in sys.modules, "pgmpy" in sys.modules)
+"""
+
+
+def test_saved_model_loads_without_weights_or_pgmpy(tmp_path):
+    """Loading prod_model.npz works from any cwd and skips weights.py."""
+    env = {**os.environ, "PYTHONPATH": str(PACKAGE_ROOT.parent)}
+    completed = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.split() == ["False", "False"]
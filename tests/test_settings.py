@@ -0,0 +1,84 @@
+"""Tests for environment / .env settings parsing."""
+
+import pytest
+
+from freq_app.config.settings import load_settings, Settings
+
+SETTING_NAMES = (
+    "APP_NAME",
+    "ENV",
+    "PORT",
+    "BUILD_WEIGHTS",
+    "RAW_PROBS_FILE",
+    "BASE_FRAUD_RATE",
+)
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """An empty .env file, with no setting names in the environment."""
+    for name in SETTING_NAMES:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    path = tmp_path / ".env"
+    path.write_text("", encoding="utf-8")
+    return path
+
+
+def test_defaults(env_file):
+    """Unset names fall back to the Settings defaults."""
+    assert load_settings(str(env_file)) == Settings()
+
+
+def test_env_file_and_environment(env_file, monkeypatch):
+    """.env values are read and environment variables override them."""
+    env_file.write_text(
+        "ENV=prod\n"
+        "PORT=9000  # inline comment\n"
+        "BUILD_WEIGHTS=true\n"
+        "BASE_FRAUD_RATE=0.05\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("PORT", "9100")
+
+    settings = load_settings(str(env_file))
+
+    assert settings.env == "prod"
+    assert settings.port == 9100
+    assert settings.build_weights is True
+    assert settings.base_fraud_rate == pytest.approx(0.05)
+
+
+def test_names_are_case_insensitive(env_file, monkeypatch):
+    """Lower-case names are matched, as pydantic-settings did."""
+    monkeypatch.setenv("env", "prod")
+    monkeypatch.setenv("build_weights", "No")
+
+    settings = load_settings(str(env_file))
+
+    assert settings.env == "prod"
+    assert settings.build_weights is False
+
+
+def test_empty_is_not_unset(env_file, monkeypatch):
+    """A set-but-empty string is kept, not replaced by the default."""
+    monkeypatch.setenv("APP_NAME", "")
+
+    assert load_settings(str(env_file)).app_name == ""
+
+
+@pytest.mark.parametrize(
+    "name, raw_value",
+    [
+        ("BUILD_WEIGHTS", "maybe"),
+        ("PORT", ""),
+        ("PORT", "eighty"),
+        ("BASE_FRAUD_RATE", "high"),
+    ],
+)
+def test_invalid_values_raise(env_file, monkeypatch, name, raw_value):
+    """Unparseable bool / numeric values raise ValueError."""
+    monkeypatch.setenv(name, raw_value)
+
+    with pytest.raises(ValueError, match=name):
+        load_settings(str(env_file))